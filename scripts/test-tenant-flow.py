@@ -7,62 +7,161 @@ Tests the complete public reservation flow:
 2. Tenant check-in with reservation ID
 3. Tenant configuration validation
 4. cheqd DID creation testing
-5. Public DID assignment
-6. Final issuer status validation
+5. Public DID assignment and issuer status validation
 
 Usage:
-    python test-tenant-flow.py [--base-url BASE_URL] [--debug]
+    python test-tenant-flow.py [--base-url BASE_URL] [--debug] [--probe]
 """
 
 import argparse
 import json
 import time
 import sys
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
+
+# Failures a step reports and recovers from: transport errors and malformed responses.
+# Anything else is a bug in this script and should surface with a traceback.
+STEP_ERRORS = (RequestException, ValueError)
+
+# cheqd DID create payload formats, in order of preference; the first is the current contract
+CHEQD_DID_PAYLOADS = [
+    {
+        "options": {
+            "network": "xanadu",
+            "key_type": "ed25519"
+        }
+    },
+    {
+        "options": {
+            "network": "xanadu",
+            "key_type": "ed25519",
+            "method_specific_id_algo": "uuid"
+        }
+    },
+    {
+        "options": {
+            "network": "xanadu",
+            "key_type": "ed25519"
+        },
+        "features": {}
+    }
+]
+
+# Statuses that may mean the payload shape is wrong, so another format is worth trying
+PAYLOAD_RETRY_STATUSES = (400, 422, 500)
+# Statuses that mean the endpoint itself is wrong; no payload format will help
+ENDPOINT_REJECTED_STATUSES = (401, 403, 404)
+
+# Remembers, per base URL, which payload format the server accepted last
+PAYLOAD_CACHE_FILE = Path.home() / '.traction_test_cache.json'
+
+# orjson is optional: it speeds up response parsing and debug dumps when available
+try:
+    import orjson
+
+    def parse_json(response: requests.Response) -> Any:
+        """Parse a JSON response body"""
+        return orjson.loads(response.content)
+
+    def dump_json(obj: Any) -> str:
+        """Pretty-print an object as JSON for logging"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def parse_json(response: requests.Response) -> Any:
+        """Parse a JSON response body"""
+        return response.json()
+
+    def dump_json(obj: Any) -> str:
+        """Pretty-print an object as JSON for logging"""
+        return json.dumps(obj, indent=2)
+
+
+def parse_json_object(response: requests.Response) -> Dict:
+    """Parse a JSON response body that must be an object; anything else is a ValueError"""
+    data = parse_json(response)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object in response, got {type(data).__name__}")
+    return data
 
 
 class TractionTester:
     """Test the complete Traction tenant onboarding flow"""
     
-    def __init__(self, base_url: str = "http://localhost:8032", debug: bool = False):
+    def __init__(self, base_url: str = "http://localhost:8032", debug: bool = False, probe: bool = False):
         self.base_url = base_url.rstrip('/')
+        self._urls: Dict[str, str] = {}
         self.debug = debug
+        self.probe = probe
+        # (connect, read) timeout applied to every request; the read timeout
+        # leaves room for cheqd DID creation, which waits on a ledger write
+        self.timeout = (3.05, 30)
         self.session = requests.Session()
+        # Reuse one keep-alive connection per host instead of paying a
+        # TCP/TLS handshake on every step, and fail fast on a dead server
+        # rather than retrying behind our back
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=0, connect=0, read=0))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'})
         self.tenant_token = None
         self.reservation_id = None
         self.reservation_pwd = None
         self.created_did = None
+        self._known_good_payload_idx: Optional[int] = self._load_known_good_payload_idx()
+        # (epoch second, formatted timestamp) of the last log line
+        self._last_timestamp: Tuple[int, str] = (0, '')
+        
+    def timestamp(self) -> str:
+        """Current log timestamp, formatted at most once per second"""
+        now = int(time.time())
+        second, timestamp = self._last_timestamp
+        if now != second:
+            # A single tuple keeps the cached pair consistent across threads
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self._last_timestamp = (now, timestamp)
+        return timestamp
         
     def log(self, message: str, level: str = "INFO"):
         """Log messages with timestamp"""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        print(f"[{self.timestamp()}] {level}: {message}")
         
     def log_request(self, method: str, url: str, payload: Any = None, headers: Any = None):
         """Log HTTP request details if debug enabled"""
         if self.debug:
             self.log(f"REQUEST: {method} {url}", "DEBUG")
             if headers:
-                self.log(f"HEADERS: {json.dumps(dict(headers), indent=2)}", "DEBUG")
+                self.log(f"HEADERS: {dump_json(headers)}", "DEBUG")
             if payload:
-                self.log(f"PAYLOAD: {json.dumps(payload, indent=2)}", "DEBUG")
+                self.log(f"PAYLOAD: {dump_json(payload)}", "DEBUG")
                 
     def log_response(self, response: requests.Response):
         """Log HTTP response details if debug enabled"""
         if self.debug:
             self.log(f"RESPONSE: {response.status_code} {response.reason}", "DEBUG")
-            self.log(f"RESPONSE HEADERS: {json.dumps(dict(response.headers), indent=2)}", "DEBUG")
+            self.log(f"RESPONSE HEADERS: {dump_json(dict(response.headers))}", "DEBUG")
+            # A steady count across requests means the keep-alive socket is being reused
+            pool = getattr(response.raw, '_pool', None)
+            if pool is not None:
+                self.log(f"CONNECTIONS OPENED TO HOST: {pool.num_connections}", "DEBUG")
             try:
-                content = response.json()
-                self.log(f"RESPONSE BODY: {json.dumps(content, indent=2)}", "DEBUG")
+                content = parse_json(response)
+                self.log(f"RESPONSE BODY: {dump_json(content)}", "DEBUG")
             except:
                 self.log(f"RESPONSE BODY (text): {response.text}", "DEBUG")
     
     def make_request(self, method: str, endpoint: str, payload: Any = None, 
                     headers: Optional[Dict] = None, use_auth: bool = False) -> requests.Response:
         """Make HTTP request with proper logging and error handling"""
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self.base_url + endpoint
         req_headers = headers or {}
         
         if use_auth and self.tenant_token:
@@ -70,23 +169,37 @@ class TractionTester:
             
         self.log_request(method, url, payload, req_headers)
         
+        # Raw bytes are sent as-is, anything else is JSON encoded by requests
+        if isinstance(payload, bytes):
+            body = {'data': payload}
+        elif payload is not None:
+            body = {'json': payload}
+        else:
+            body = {}
+        
         try:
             if method.upper() == 'GET':
-                response = self.session.get(url, headers=req_headers)
+                response = self.session.get(url, headers=req_headers, timeout=self.timeout)
             elif method.upper() == 'POST':
-                response = self.session.post(url, json=payload, headers=req_headers)
+                response = self.session.post(url, headers=req_headers, timeout=self.timeout, **body)
             elif method.upper() == 'PUT':
-                response = self.session.put(url, json=payload, headers=req_headers)
+                response = self.session.put(url, headers=req_headers, timeout=self.timeout, **body)
             else:
                 raise ValueError(f"Unsupported method: {method}")
                 
             self.log_response(response)
             return response
             
-        except Exception as e:
+        except RequestException as e:
             self.log(f"Request failed: {str(e)}", "ERROR")
             raise
     
+    def get_many(self, *endpoints: str, use_auth: bool = False) -> List[Future]:
+        """Issue independent GET requests concurrently, returning futures in endpoint order"""
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            return [executor.submit(self.make_request, 'GET', endpoint, use_auth=use_auth)
+                    for endpoint in endpoints]
+    
     def step_1_create_public_reservation(self) -> bool:
         """Step 1: Create public reservation (self-service)"""
         self.log("=== STEP 1: Create Public Reservation ===")
@@ -100,7 +213,7 @@ class TractionTester:
             response = self.make_request('POST', '/multitenancy/reservations', payload)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json_object(response)
                 self.reservation_id = data.get('reservation_id')
                 self.reservation_pwd = data.get('reservation_pwd')
                 self.log(f"✅ Reservation created successfully: {self.reservation_id}")
@@ -111,7 +224,7 @@ class TractionTester:
                 self.log(f"Response: {response.text}", "ERROR")
                 return False
                 
-        except Exception as e:
+        except STEP_ERRORS as e:
             self.log(f"❌ Exception during reservation creation: {str(e)}", "ERROR")
             return False
     
@@ -131,7 +244,7 @@ class TractionTester:
             response = self.make_request('POST', f'/multitenancy/reservations/{self.reservation_id}/check-in', payload)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json_object(response)
                 self.tenant_token = data.get('token')
                 if self.tenant_token:
                     self.log("✅ Tenant check-in successful")
@@ -145,7 +258,7 @@ class TractionTester:
                 self.log(f"Response: {response.text}", "ERROR")
                 return False
                 
-        except Exception as e:
+        except STEP_ERRORS as e:
             self.log(f"❌ Exception during check-in: {str(e)}", "ERROR")
             return False
     
@@ -153,32 +266,34 @@ class TractionTester:
         """Step 3: Validate tenant and server configuration"""
         self.log("=== STEP 3: Validate Configuration ===")
         
+        # Tenant and server config are independent, fetch them concurrently
+        tenant_future, server_future = self.get_many('/tenant/config', '/status/config', use_auth=True)
+        
         # Check tenant config
         try:
-            response = self.make_request('GET', '/tenant/config', use_auth=True)
+            response = tenant_future.result()
             if response.status_code == 200:
-                config = response.json()
+                config = parse_json(response)
                 self.log("✅ Tenant config retrieved")
                 if self.debug:
-                    self.log(f"Tenant config: {json.dumps(config, indent=2)}")
+                    self.log(f"Tenant config: {dump_json(config)}")
             else:
                 self.log(f"❌ Failed to get tenant config: {response.status_code}", "ERROR")
                 return False
                 
-        except Exception as e:
+        except STEP_ERRORS as e:
             self.log(f"❌ Exception getting tenant config: {str(e)}", "ERROR")
             return False
             
         # Check server config for cheqd settings
         try:
-            response = self.make_request('GET', '/status/config', use_auth=True)
+            response = server_future.result()
             if response.status_code == 200:
-                server_config = response.json()
+                server_config = parse_json_object(response).get('config') or {}
                 self.log("✅ Server config retrieved")
                 
                 # Check for cheqd plugin configuration
-                plugin_config = server_config.get('config', {}).get('plugin_config', {})
-                cheqd_config = plugin_config.get('cheqd', {})
+                cheqd_config = (server_config.get('plugin_config') or {}).get('cheqd') or {}
                 
                 if cheqd_config:
                     self.log("✅ cheqd plugin configuration found")
@@ -189,89 +304,173 @@ class TractionTester:
                     self.log("⚠️  No cheqd plugin configuration found in server config", "WARN")
                     
                 # Check wallet type
-                wallet_type = server_config.get('config', {}).get('wallet', {}).get('type')
+                wallet_type = (server_config.get('wallet') or {}).get('type')
                 if wallet_type == 'askar-anoncreds':
                     self.log("✅ Wallet type is askar-anoncreds (required for cheqd)")
                 else:
                     self.log(f"⚠️  Wallet type is {wallet_type}, cheqd requires askar-anoncreds", "WARN")
                     
                 if self.debug:
-                    self.log(f"Server config: {json.dumps(server_config, indent=2)}")
+                    # Dump the raw body rather than re-serializing the parsed config
+                    self.log(f"Server config: {response.text}")
                     
                 return True
             else:
                 self.log(f"⚠️  Failed to get server config: {response.status_code}, continuing without validation", "WARN")
                 return True  # Continue even if server config fails
                 
-        except Exception as e:
+        except STEP_ERRORS as e:
             self.log(f"⚠️  Exception getting server config: {str(e)}, continuing", "WARN")
             return True  # Continue even if server config fails
     
+    def _load_known_good_payload_idx(self) -> Optional[int]:
+        """Read the cheqd DID payload format that last worked against this server"""
+        try:
+            with PAYLOAD_CACHE_FILE.open() as f:
+                idx = json.load(f).get(self.base_url)
+        except (OSError, ValueError, AttributeError):
+            return None
+        if isinstance(idx, int) and 0 <= idx < len(CHEQD_DID_PAYLOADS):
+            return idx
+        return None
+    
+    def _save_known_good_payload_idx(self):
+        """Remember the working cheqd DID payload format for the next run, or forget it if None"""
+        try:
+            with PAYLOAD_CACHE_FILE.open() as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        if self._known_good_payload_idx is None:
+            cache.pop(self.base_url, None)
+        else:
+            cache[self.base_url] = self._known_good_payload_idx
+        try:
+            with PAYLOAD_CACHE_FILE.open('w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            self.log(f"⚠️  Could not write payload cache {PAYLOAD_CACHE_FILE}: {str(e)}", "WARN")
+    
+    def _handle_did_response(self, i: int, response: requests.Response) -> bool:
+        """Record the DID from a create response, returns True if it supplied the DID"""
+        if 200 <= response.status_code < 300:
+            data = parse_json_object(response)
+            # cheqd DID endpoint returns DID at root level, not in 'result'
+            did = data.get('did') or (data.get('result') or {}).get('did')
+            if did and self.created_did:
+                # Requests already in flight cannot be recalled, keep the most preferred DID
+                self.log(f"Discarding extra DID from payload {i+1}: {did}")
+            elif did:
+                self.created_did = did
+                self._known_good_payload_idx = i
+                self.log(f"✅ cheqd DID created successfully with payload format {i+1}: {did}")
+                return True
+            else:
+                self.log(f"❌ No DID in successful response (payload {i+1})", "ERROR")
+                self.log(f"Response data: {dump_json(data)}", "ERROR")
+                
+        elif response.status_code == 500:
+            self.log(f"❌ Server error creating DID (payload {i+1}): {response.status_code}", "ERROR")
+            try:
+                error_data = parse_json(response)
+                self.log(f"Error details: {dump_json(error_data)}", "ERROR")
+            except:
+                self.log(f"Error response (text): {response.text}", "ERROR")
+        else:
+            self.log(f"❌ Failed to create DID (payload {i+1}): {response.status_code}", "ERROR")
+            self.log(f"Response: {response.text}", "ERROR")
+            
+        return False
+    
     def step_4_create_cheqd_did(self) -> bool:
         """Step 4: Create cheqd DID"""
         self.log("=== STEP 4: Create cheqd DID ===")
         
-        # Test different payload formats to find the right one
-        payloads_to_test = [
-            {
-                "options": {
-                    "network": "xanadu",
-                    "key_type": "ed25519"
-                }
-            },
-            {
-                "options": {
-                    "network": "xanadu",
-                    "key_type": "ed25519",
-                    "method_specific_id_algo": "uuid"
-                }
-            },
-            {
-                "options": {
-                    "network": "xanadu",
-                    "key_type": "ed25519"
-                },
-                "features": {}
-            }
-        ]
+        known_idx = self._known_good_payload_idx
+        candidates = list(range(len(CHEQD_DID_PAYLOADS)))
         
-        for i, payload in enumerate(payloads_to_test):
-            self.log(f"--- Testing payload format {i+1} ---")
-            
+        # Send the payload format that worked last time, or the canonical one. Without
+        # --probe a rejected remembered format only falls back to the canonical one
+        first_idx = known_idx if known_idx is not None else (None if self.probe else 0)
+        if first_idx is not None:
+            self.log(f"--- Using payload format {first_idx+1} ---")
             try:
-                response = self.make_request('POST', '/did/cheqd/create', payload, use_auth=True)
+                response = self.make_request('POST', '/did/cheqd/create', CHEQD_DID_PAYLOADS[first_idx], use_auth=True)
+                if self._handle_did_response(first_idx, response):
+                    if first_idx != known_idx:
+                        self._save_known_good_payload_idx()
+                    return True
+                status_code = response.status_code
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    # cheqd DID endpoint returns DID at root level, not in 'result'
-                    did = data.get('did') or data.get('result', {}).get('did')
-                    if did:
-                        self.created_did = did
-                        self.log(f"✅ cheqd DID created successfully: {did}")
-                        return True
-                    else:
-                        self.log("❌ No DID in successful response", "ERROR")
-                        self.log(f"Response data: {json.dumps(data, indent=2)}", "ERROR")
-                        
-                elif response.status_code == 500:
-                    self.log(f"❌ Server error creating DID (payload {i+1}): {response.status_code}", "ERROR")
-                    try:
-                        error_data = response.json()
-                        self.log(f"Error details: {json.dumps(error_data, indent=2)}", "ERROR")
-                    except:
-                        self.log(f"Error response (text): {response.text}", "ERROR")
-                else:
-                    self.log(f"❌ Failed to create DID (payload {i+1}): {response.status_code}", "ERROR")
-                    self.log(f"Response: {response.text}", "ERROR")
+            except STEP_ERRORS as e:
+                self.log(f"❌ Exception during DID creation (payload {first_idx+1}): {str(e)}", "ERROR")
+                status_code = None
+                
+            if known_idx is not None and status_code in PAYLOAD_RETRY_STATUSES:
+                # The server rejected the remembered format itself, start from the canonical one next run
+                self._known_good_payload_idx = None
+                self._save_known_good_payload_idx()
+                
+            if status_code in ENDPOINT_REJECTED_STATUSES:
+                self.log(f"❌ Endpoint rejected with {status_code}, not retrying payload variants", "ERROR")
+                return False
+            if status_code not in PAYLOAD_RETRY_STATUSES:
+                return False
+                
+            if self.probe:
+                self.log("⚠️  Payload format rejected, probing the others", "WARN")
+                candidates.remove(first_idx)
+            elif first_idx != 0:
+                self.log("⚠️  Remembered payload format rejected, falling back to the canonical one", "WARN")
+                candidates = [0]
+            else:
+                return False
+        
+        # Fire the remaining payload variants at once and wait for all of them
+        responses: Dict[int, requests.Response] = {}
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            futures = {
+                executor.submit(self.make_request, 'POST', '/did/cheqd/create', CHEQD_DID_PAYLOADS[i], use_auth=True): i
+                for i in candidates
+            }
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    responses[i] = future.result()
+                except STEP_ERRORS as e:
+                    self.log(f"❌ Exception during DID creation (payload {i+1}): {str(e)}", "ERROR")
+                    
+        # Handle responses in order of preference, so the lowest-index success supplies
+        # the DID and becomes the known-good format; later successes are discarded
+        endpoint_rejected = False
+        for i in sorted(responses):
+            response = responses[i]
+            try:
+                if self._handle_did_response(i, response):
+                    continue
+                if response.status_code in ENDPOINT_REJECTED_STATUSES and not endpoint_rejected:
+                    # Every variant hit the same endpoint, so report the rejection once
+                    self.log(f"❌ Endpoint rejected with {response.status_code}", "ERROR")
+                    endpoint_rejected = True
                     
-            except Exception as e:
+            except STEP_ERRORS as e:
                 self.log(f"❌ Exception during DID creation (payload {i+1}): {str(e)}", "ERROR")
                 
+        if self.created_did:
+            if self._known_good_payload_idx != known_idx:
+                self._save_known_good_payload_idx()
+            return True
+        if endpoint_rejected:
+            return False
+            
         self.log("❌ All payload formats failed", "ERROR")
         return False
     
     def step_5_assign_public_did(self) -> bool:
-        """Step 5: Assign the created DID as public DID"""
+        """Step 5: Assign the created DID as public DID and confirm the tenant can issue"""
         self.log("=== STEP 5: Assign Public DID ===")
         
         if not self.created_did:
@@ -280,7 +479,7 @@ class TractionTester:
             
         try:
             response = self.make_request('POST', f'/wallet/did/public?did={self.created_did}', 
-                                      {}, use_auth=True)
+                                      b'', use_auth=True)
             
             if response.status_code == 200:
                 self.log(f"✅ Public DID assigned successfully: {self.created_did}")
@@ -288,10 +487,16 @@ class TractionTester:
                 # Verify assignment
                 response = self.make_request('GET', '/wallet/did/public', use_auth=True)
                 if response.status_code == 200:
-                    public_did_data = response.json()
-                    assigned_did = public_did_data.get('result', {}).get('did')
+                    public_did_data = parse_json_object(response)
+                    result = public_did_data.get('result')
+                    if not result or not isinstance(result, dict):
+                        self.log("❌ No public DID found", "ERROR")
+                        return False
+                        
+                    assigned_did = result.get('did')
                     if assigned_did == self.created_did:
                         self.log("✅ Public DID assignment verified")
+                        self.log("✅ Tenant has public DID - ready for issuance")
                         return True
                     else:
                         self.log(f"❌ DID assignment mismatch. Expected: {self.created_did}, Got: {assigned_did}", "ERROR")
@@ -304,38 +509,27 @@ class TractionTester:
                 self.log(f"Response: {response.text}", "ERROR")
                 return False
                 
-        except Exception as e:
+        except STEP_ERRORS as e:
             self.log(f"❌ Exception during public DID assignment: {str(e)}", "ERROR")
             return False
     
-    def step_6_validate_issuer_status(self) -> bool:
-        """Step 6: Validate final issuer status"""
-        self.log("=== STEP 6: Validate Issuer Status ===")
-        
+    def _warmup(self):
+        """Open a pooled connection to the server before the timed flow starts"""
         try:
-            # Check if tenant is now ready for issuance
-            response = self.make_request('GET', '/wallet/did/public', use_auth=True)
-            if response.status_code == 200:
-                public_did_data = response.json()
-                if public_did_data.get('result'):
-                    self.log("✅ Tenant has public DID - ready for issuance")
-                    return True
-                else:
-                    self.log("❌ No public DID found", "ERROR")
-                    return False
-            else:
-                self.log(f"❌ Failed to check issuer status: {response.status_code}", "ERROR")
-                return False
-                
-        except Exception as e:
-            self.log(f"❌ Exception during issuer status check: {str(e)}", "ERROR")
-            return False
+            self.session.head(self.base_url + '/status/live', timeout=2)
+        except RequestException as e:
+            # Best effort only; step 1 will open the connection itself
+            if self.debug:
+                self.log(f"Connection warm-up failed: {str(e)}", "DEBUG")
     
     def run_full_test(self) -> bool:
         """Run the complete test flow"""
         self.log("🚀 Starting Traction Tenant Onboarding Flow Test")
         self.log(f"Base URL: {self.base_url}")
         self.log(f"Debug mode: {self.debug}")
+        self.log(f"Payload probing: {self.probe}")
+        
+        self._warmup()
         
         steps = [
             ("Create Public Reservation", self.step_1_create_public_reservation),
@@ -343,15 +537,14 @@ class TractionTester:
             ("Validate Configuration", self.step_3_validate_configuration),
             ("Create cheqd DID", self.step_4_create_cheqd_did),
             ("Assign Public DID", self.step_5_assign_public_did),
-            ("Validate Issuer Status", self.step_6_validate_issuer_status),
         ]
         
-        results = {}
+        results = []
         
         for step_name, step_func in steps:
             self.log(f"\n🔄 Executing: {step_name}")
             success = step_func()
-            results[step_name] = success
+            results.append((step_name, success))
             
             if success:
                 self.log(f"✅ {step_name} completed successfully")
@@ -359,23 +552,26 @@ class TractionTester:
                 self.log(f"❌ {step_name} failed")
                 break
                 
-        # Final summary
-        self.log("\n📊 TEST SUMMARY")
-        self.log("=" * 50)
+        # Final summary, built up and written in one go under a single timestamp
+        prefix = f"[{self.timestamp()}] INFO: "
+        lines = [f"{prefix}\n📊 TEST SUMMARY", f"{prefix}{'=' * 50}"]
         
         all_passed = True
-        for step_name, success in results.items():
-            status = "✅ PASS" if success else "❌ FAIL"
-            self.log(f"{step_name}: {status}")
+        passed, failed = "✅ PASS", "❌ FAIL"
+        for step_name, success in results:
+            lines.append(f"{prefix}{step_name}: {passed if success else failed}")
             if not success:
                 all_passed = False
                 
         if all_passed:
-            self.log("\n🎉 ALL TESTS PASSED - Tenant onboarding flow working correctly!")
-            self.log(f"Created DID: {self.created_did}")
+            lines.append(f"{prefix}\n🎉 ALL TESTS PASSED - Tenant onboarding flow working correctly!")
+            lines.append(f"{prefix}Created DID: {self.created_did}")
         else:
-            self.log(f"\n💥 TESTS FAILED - Issue identified in tenant onboarding flow")
+            lines.append(f"{prefix}\n💥 TESTS FAILED - Issue identified in tenant onboarding flow")
             
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+        
         return all_passed
 
 
@@ -387,10 +583,13 @@ def main():
     parser.add_argument('--debug', 
                        action='store_true',
                        help='Enable detailed debug logging')
+    parser.add_argument('--probe', 
+                       action='store_true',
+                       help='Try alternative cheqd DID payload formats if the first one is rejected')
     
     args = parser.parse_args()
     
-    tester = TractionTester(base_url=args.base_url, debug=args.debug)
+    tester = TractionTester(base_url=args.base_url, debug=args.debug, probe=args.probe)
     success = tester.run_full_test()
     
     sys.exit(0 if success else 1)